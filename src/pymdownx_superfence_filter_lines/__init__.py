@@ -3,16 +3,21 @@
 
 """A custom superfence for pymdown-extensions that can filters lines and plays nice with MkDocs."""
 
+import collections
 import dataclasses
-import inspect
+import functools
+import io
 import logging
-from typing import Any, NotRequired, Self, Set, TypedDict, cast
+import sys
+import threading
+from types import FrameType
+from typing import Any, NotRequired, Self, TypedDict, TypeVar, cast
 
 import markdown
 from pymdownx.superfences import SuperFencesBlockPreprocessor, highlight_validator
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class LinesRange:
     """A range of lines.
 
@@ -31,27 +36,106 @@ class LinesRange:
     `None` means the end of the file.
     """
 
+    _lo: int = dataclasses.field(init=False, repr=False, compare=False, hash=False)
+    """The first line in the range, with `None` replaced by 1."""
+
+    _hi: int = dataclasses.field(init=False, repr=False, compare=False, hash=False)
+    """The last line in the range, with `None` replaced by `sys.maxsize`."""
+
+    _h: int = dataclasses.field(init=False, repr=False, compare=False, hash=False)
+    """The precomputed hash."""
+
     def __post_init__(self) -> None:
-        """Validate inputs upon creation."""
-        if self.start is None and self.end is None:
+        """Validate inputs upon creation and precompute the bounds and hash."""
+        self._validate(self.start, self.end)
+        self._set_derived()
+
+    @staticmethod
+    def _validate(start: int | None, end: int | None) -> None:
+        """Validate the start and end of a range.
+
+        Args:
+            start: Start line.
+            end: End line.
+
+        Raises:
+            ValueError: If the start and end are not a valid range.
+        """
+        if start is None and end is None:
             raise ValueError("Cannot have both start and end as `None`")
-        if self.start is not None and self.start < 1:
+        if start is not None and start < 1:
             raise ValueError("Start must be at least 1")
-        if self.end is not None and self.end < 1:
+        if end is not None and end < 1:
             raise ValueError("End must be at least 1")
-        if self.start is not None and self.end is not None and self.start > self.end:
+        if start is not None and end is not None and start > end:
             raise ValueError("Start must be less than or equal to end")
 
-    def __contains__(self, item: int) -> bool:
-        """Whether the item is inside this range."""
-        if self.start is None:
-            assert self.end is not None
-            return item <= self.end
+    @classmethod
+    def get(cls, *, start: int | None = None, end: int | None = None) -> Self:
+        """Get a shared range.
 
-        if self.end is None:
-            return self.start <= item
+        Ranges are immutable, so the same instance is returned for the same `start`
+        and `end`, instead of creating a new one each time.
+
+        Args:
+            start: Start line.
+            end: End line.
+
+        Returns:
+            The shared range.
+
+        Raises:
+            ValueError: If the inputs are invalid.
+        """
+        return _get_from_lines_range_pool(cls, start, end, validate=True)
+
+    @classmethod
+    def _unsafe(cls, start: int | None, end: int | None) -> Self:
+        """Get a shared range without validating the inputs.
 
-        return self.start <= item <= self.end
+        Only to be used when the inputs were already validated.
+
+        Args:
+            start: Start line.
+            end: End line.
+
+        Returns:
+            The shared range.
+        """
+        return _get_from_lines_range_pool(cls, start, end, validate=False)
+
+    @classmethod
+    def _create_unchecked(cls, start: int | None, end: int | None) -> Self:
+        """Create a new range without validating the inputs.
+
+        Args:
+            start: Start line.
+            end: End line.
+
+        Returns:
+            The created range.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "start", start)
+        object.__setattr__(obj, "end", end)
+        obj._set_derived()  # pylint: disable=protected-access
+        return obj
+
+    def _set_derived(self) -> None:
+        """Precompute the bounds and hash."""
+        object.__setattr__(self, "_lo", 1 if self.start is None else self.start)
+        object.__setattr__(self, "_hi", sys.maxsize if self.end is None else self.end)
+        object.__setattr__(
+            self, "_h", ((self.start or 0) << 32) | (self.end or 0xFFFFFFFF)
+        )
+
+    def __hash__(self) -> int:
+        """Get the precomputed hash."""
+        return self._h
+
+    def __contains__(self, item: int) -> bool:
+        """Whether the item is inside this range."""
+        return self._lo <= item <= self._hi
 
     @classmethod
     def parse(cls, text: str) -> Self:
@@ -81,23 +165,23 @@ class LinesRange:
         Raises:
             ValueError: If the string is invalid.
         """
-        splitted = text.split(":", 1)
-        stripped = map(lambda s: s.strip(), splitted)
-        match tuple(map(lambda s: s if s else None, stripped)):
-            case (None,):
+        start, sep, end = text.partition(":")
+        start = start.strip()
+        if not sep:
+            if not start:
                 raise ValueError("Empty start")
-            case () | (None, None):
-                raise ValueError("Both start and end are empty")
-            case (str() as start,):
-                return cls(start=int(start), end=int(start))
-            case (str() as start, None):
-                return cls(start=int(start))
-            case (None, str() as end):
-                return cls(end=int(end))
-            case (str() as start, str() as end):
-                return cls(start=int(start), end=int(end))
-            case _ as invalid:
-                raise ValueError(f"Invalid: {invalid!r}")
+            line = int(start)
+            cls._validate(line, line)
+            return cls._unsafe(line, line)
+
+        end = end.strip()
+        if not start and not end:
+            raise ValueError("Both start and end are empty")
+        # If `end` has more `:`, `int()` will fail and report it
+        start_line = int(start) if start else None
+        end_line = int(end) if end else None
+        cls._validate(start_line, end_line)
+        return cls._unsafe(start_line, end_line)
 
     def __str__(self) -> str:
         """Get the string representation."""
@@ -109,21 +193,121 @@ class LinesRange:
         return f"{self.start}:{self.end}"
 
 
-@dataclasses.dataclass(frozen=True)
+_LinesRangeT = TypeVar("_LinesRangeT", bound=LinesRange)
+"""Type variable for `LinesRange` subclasses."""
+
+_LINES_RANGE_POOL_MAX_SIZE = 1024
+"""The maximum number of ranges to keep in the pool of shared ranges.
+
+When the pool is full, the least recently used range is evicted.
+"""
+
+_LinesRangeKey = tuple[type[LinesRange], int | None, int | None]
+"""The key of a range in the pool of shared ranges: its class, start and end."""
+
+_lines_range_pool: collections.OrderedDict[_LinesRangeKey, LinesRange] = (
+    collections.OrderedDict()
+)
+"""The pool of shared ranges, from least to most recently used."""
+
+_lines_range_pool_lock = threading.Lock()
+"""The lock to guard the pool of shared ranges."""
+
+
+def _get_from_lines_range_pool(
+    cls: type[_LinesRangeT], start: int | None, end: int | None, *, validate: bool
+) -> _LinesRangeT:
+    """Get a range from the pool of shared ranges, creating it if it is not there.
+
+    Args:
+        cls: The class of the range.
+        start: Start line.
+        end: End line.
+        validate: Whether to validate the inputs when a new range is created.
+
+    Returns:
+        The shared range.
+
+    Raises:
+        ValueError: If `validate` is true and the inputs are invalid.
+    """
+    key = (cls, start, end)
+    with _lines_range_pool_lock:
+        if (pooled := _lines_range_pool.get(key)) is not None:
+            _lines_range_pool.move_to_end(key)
+            return cast(_LinesRangeT, pooled)
+        if validate:
+            lines_range = cls(start=start, end=end)
+        else:
+            # pylint: disable-next=protected-access
+            lines_range = cls._create_unchecked(start, end)
+        _lines_range_pool[key] = lines_range
+        if len(_lines_range_pool) > _LINES_RANGE_POOL_MAX_SIZE:
+            _lines_range_pool.popitem(last=False)
+        return lines_range
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class LinesRanges:
     """A set of line ranges."""
 
-    ranges: Set[LinesRange]
-    """The lines ranges."""
+    ranges: tuple[LinesRange, ...]
+    """The lines ranges.
+
+    The ranges are deduplicated and sorted on creation.
+    """
+
+    _intervals: tuple[tuple[int, int], ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    """The ranges as sorted, merged and non-overlapping `(start, end)` intervals.
+
+    Open starts are replaced by 1 and open ends by `sys.maxsize`.
+    """
+
+    covers_all: bool = dataclasses.field(init=False, repr=False, compare=False)
+    """Whether the ranges cover all the lines."""
 
     def __post_init__(self) -> None:
-        """Validate."""
+        """Validate, normalize the ranges and precompute the merged intervals."""
         if not self.ranges:
             raise ValueError("Cannot have empty ranges")
 
+        object.__setattr__(
+            self,
+            "ranges",
+            tuple(
+                sorted(
+                    set(self.ranges),
+                    key=lambda r: (r.start or 0, r.end is None, r.end or 0),
+                )
+            ),
+        )
+
+        intervals: list[tuple[int, int]] = []
+        # pylint: disable-next=protected-access
+        for start, end in sorted((r._lo, r._hi) for r in self.ranges):
+            # Merge with the previous interval if they overlap or are adjacent
+            if intervals and start <= intervals[-1][1] + 1:
+                if end > intervals[-1][1]:
+                    intervals[-1] = (intervals[-1][0], end)
+                continue
+            intervals.append((start, end))
+        object.__setattr__(self, "_intervals", tuple(intervals))
+        object.__setattr__(
+            self, "covers_all", len(intervals) == 1 and intervals[0] == (1, sys.maxsize)
+        )
+
     def __contains__(self, item: int) -> bool:
         """Whether the item is inside any of the ranges."""
-        return any(item in r for r in self.ranges)
+        # The intervals are sorted and don't overlap, so we can stop at the first one
+        # that starts after the item
+        for start, end in self._intervals:
+            if start > item:
+                return False
+            if item <= end:
+                return True
+        return False
 
     @classmethod
     def parse(cls, text: str) -> tuple[Self | None, list[ValueError]]:
@@ -143,24 +327,50 @@ class LinesRanges:
             The created ranges, or `None` if no ranges are given, plus a list of errors,
                 if any.
         """
-        ranges: set[LinesRange] = set()
-        errors: list[ValueError] = []
-        for n, range_str in enumerate(text.split(","), start=1):
-            try:
-                lines_range = LinesRange.parse(range_str.strip())
-            except ValueError as exc:
-                error = ValueError(f"Range {n} ({range_str!r}) is invalid: {exc}")
-                error.__cause__ = exc
-                errors.append(error)
-                continue
-            ranges.add(lines_range)
-        return cls(ranges) if ranges else None, errors
+        # mypy doesn't know classes are hashable when used as `lru_cache` arguments
+        lines_ranges, errors = _parse_lines_ranges_cached(
+            cls, text  # type: ignore[arg-type]
+        )
+        return lines_ranges, [ValueError(error) for error in errors]
 
     def __str__(self) -> str:
         """Get the string representation."""
         return ",".join(map(str, self.ranges))
 
 
+_LinesRangesT = TypeVar("_LinesRangesT", bound=LinesRanges)
+"""Type variable for `LinesRanges` subclasses."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_lines_ranges_cached(
+    cls: type[_LinesRangesT], text: str
+) -> tuple[_LinesRangesT | None, tuple[str, ...]]:
+    """Parse lines ranges, caching the result.
+
+    The same `show_lines` option is usually repeated in many blocks, so parsing results
+    are cached. Errors are returned as messages, so the cached value is immutable.
+
+    Args:
+        cls: The class to create.
+        text: String to parse.
+
+    Returns:
+        The created ranges, or `None` if no ranges are given, plus the error messages,
+            if any.
+    """
+    ranges: set[LinesRange] = set()
+    errors: list[str] = []
+    for n, range_str in enumerate(text.split(","), start=1):
+        try:
+            lines_range = LinesRange.parse(range_str.strip())
+        except ValueError as exc:
+            errors.append(f"Range {n} ({range_str!r}) is invalid: {exc}")
+            continue
+        ranges.add(lines_range)
+    return cls(tuple(ranges)) if ranges else None, tuple(errors)
+
+
 class Inputs(TypedDict):
     """Raw input options before they are validated."""
 
@@ -185,7 +395,11 @@ def do_validate(
     """Validate the inputs."""
     # Parse `show_lines` option
     if show_lines_option := inputs.get("show_lines"):
-        lines_ranges, errors = LinesRanges.parse(show_lines_option)
+        # Use the parser directly to get the error messages, as creating `ValueError`s
+        # just to log them is wasteful
+        lines_ranges, errors = _parse_lines_ranges_cached(
+            LinesRanges, show_lines_option
+        )
 
         for error in errors:
             _warn(
@@ -214,12 +428,11 @@ def do_format(
 ) -> Any:
     """Filter the lines and run the default highlighter."""
     # Filter the lines to show
-    if show_lines := options.get("show_lines"):
-        lines = []
-        for n, line in enumerate(src.splitlines(keepends=True), 1):
-            if n in show_lines:
-                lines.append(line)
-        src = "".join(lines)
+    show_lines = options.get("show_lines")
+    if show_lines and not show_lines.covers_all:
+        src = _slice_by_intervals(
+            src, show_lines._intervals  # pylint: disable=protected-access
+        )
 
     # Run through default highlighter
     fenced_code_block = md.preprocessors["fenced_code_block"]
@@ -234,6 +447,42 @@ def do_format(
     )
 
 
+def _slice_by_intervals(src: str, intervals: tuple[tuple[int, int], ...]) -> str:
+    """Get the lines inside the intervals from a source string.
+
+    Instead of splitting the source into lines, the source is scanned for newlines and
+    each interval is written as a single slice to one output buffer.
+
+    Args:
+        src: The source to filter.
+        intervals: The sorted, merged and non-overlapping `(start, end)` intervals to
+            keep, both inclusive and 1-indexed.
+
+    Returns:
+        The lines inside the intervals.
+    """
+    buf = io.StringIO()
+    pos = 0
+    line = 1
+    for start, end in intervals:
+        while line < start:
+            newline = src.find("\n", pos)
+            if newline == -1:
+                return buf.getvalue()
+            pos = newline + 1
+            line += 1
+        start_pos = pos
+        while line <= end:
+            newline = src.find("\n", pos)
+            if newline == -1:
+                buf.write(src[start_pos:])
+                return buf.getvalue()
+            pos = newline + 1
+            line += 1
+        buf.write(src[start_pos:pos])
+    return buf.getvalue()
+
+
 def _warn(msg: str, /, *args: Any, **kwargs: Any) -> None:
     """Emit a warning.
 
@@ -243,11 +492,16 @@ def _warn(msg: str, /, *args: Any, **kwargs: Any) -> None:
 
     If we are not running inside MkDocs, then we use the logger for this module.
 
+    The logger is determined when the first warning is emitted and then reused.
+
     Args:
         msg: Message to emit.
         *args: Arguments to format the message with.
         **kwargs: Keyword arguments to format the message with.
     """
+    global _warn_logger  # pylint: disable=global-statement
+    if _warn_logger is None:
+        _warn_logger = _get_warn_logger()
     _warn_logger.warning(msg, *args, **kwargs)
 
 
@@ -259,16 +513,20 @@ def _get_warn_logger() -> logging.Logger:
 
 
 def _is_running_inside_mkdocs() -> bool:
-    """Whether we are running inside MkDocs or not."""
-    for frame_record in inspect.stack():
-        frame = frame_record.frame
-        module = inspect.getmodule(frame)
-        if module is not None:
-            # Check if the module's name is associated with MkDocs
-            if module.__name__.startswith("mkdocs."):
-                return True
+    """Whether we are running inside MkDocs or not.
+
+    This is checked when the first warning is emitted instead of at import time, as
+    MkDocs might not be imported yet when this module is imported. The call stack is
+    walked directly through the frames, which is much cheaper than `inspect.stack()`.
+    """
+    frame: FrameType | None = sys._getframe(1)  # pylint: disable=protected-access
+    while frame is not None:
+        name = frame.f_globals.get("__name__", "")
+        if name == "mkdocs" or name.startswith("mkdocs."):
+            return True
+        frame = frame.f_back
     return False
 
 
-_warn_logger: logging.Logger = _get_warn_logger()
-"""The logger to use for warnings."""
+_warn_logger: logging.Logger | None = None
+"""The logger to use for warnings, `None` until the first warning is emitted."""
@@ -50,38 +50,38 @@ _cases = [
     _TestCase(title="No options", expected_src=_SOURCE),
     _TestCase(
         title="First line",
-        options=Options(show_lines=LinesRanges({LinesRange(start=1, end=1)})),
+        options=Options(show_lines=LinesRanges((LinesRange(start=1, end=1),))),
         expected_src="""\
 1. This is some text
 """,
     ),
     _TestCase(
         title="Middle line",
-        options=Options(show_lines=LinesRanges({LinesRange(start=3, end=3)})),
+        options=Options(show_lines=LinesRanges((LinesRange(start=3, end=3),))),
         expected_src="""\
 3. and we want to filter some of them
 """,
     ),
     _TestCase(
         title="Last line",
-        options=Options(show_lines=LinesRanges({LinesRange(start=7, end=7)})),
+        options=Options(show_lines=LinesRanges((LinesRange(start=7, end=7),))),
         expected_src="""\
 7. and we can also filter multiple ranges
 """,
     ),
     _TestCase(
         title="Open range from the start",
-        options=Options(show_lines=LinesRanges({LinesRange(start=1)})),
+        options=Options(show_lines=LinesRanges((LinesRange(start=1),))),
         expected_src=_SOURCE,
     ),
     _TestCase(
         title="Open range until the end",
-        options=Options(show_lines=LinesRanges({LinesRange(end=7)})),
+        options=Options(show_lines=LinesRanges((LinesRange(end=7),))),
         expected_src=_SOURCE,
     ),
     _TestCase(
         title="Open range with start in the middle",
-        options=Options(show_lines=LinesRanges({LinesRange(start=3)})),
+        options=Options(show_lines=LinesRanges((LinesRange(start=3),))),
         expected_src="""\
 3. and we want to filter some of them
 4. we number them
@@ -92,7 +92,7 @@ _cases = [
     ),
     _TestCase(
         title="Open range with end in the middle",
-        options=Options(show_lines=LinesRanges({LinesRange(end=3)})),
+        options=Options(show_lines=LinesRanges((LinesRange(end=3),))),
         expected_src="""\
 1. This is some text
 2. which has multiple lines
@@ -102,7 +102,7 @@ _cases = [
     # range with start and end in the middle
     _TestCase(
         title="Open range with start and end in the middle",
-        options=Options(show_lines=LinesRanges({LinesRange(start=2, end=4)})),
+        options=Options(show_lines=LinesRanges((LinesRange(start=2, end=4),))),
         expected_src="""\
 2. which has multiple lines
 3. and we want to filter some of them
@@ -113,11 +113,11 @@ _cases = [
         title="Multiple lines",
         options=Options(
             show_lines=LinesRanges(
-                {
+                (
                     LinesRange(start=1, end=1),
                     LinesRange(start=3, end=3),
                     LinesRange(start=6, end=6),
-                }
+                )
             )
         ),
         expected_src="""\
@@ -130,11 +130,11 @@ _cases = [
         title="Multiple ranges",
         options=Options(
             show_lines=LinesRanges(
-                {
+                (
                     LinesRange(end=2),
                     LinesRange(start=4, end=5),
                     LinesRange(start=6),
-                }
+                )
             )
         ),
         expected_src="""\
@@ -150,12 +150,12 @@ _cases = [
         title="Multiple ranges with overlap",
         options=Options(
             show_lines=LinesRanges(
-                {
+                (
                     LinesRange(end=2),
                     LinesRange(start=2, end=5),
                     LinesRange(start=4, end=6),
                     LinesRange(start=6),
-                }
+                )
             )
         ),
         expected_src=_SOURCE,
@@ -164,12 +164,12 @@ _cases = [
         title="Multiple ranges and lines",
         options=Options(
             show_lines=LinesRanges(
-                {
+                (
                     LinesRange(end=1),
                     LinesRange(start=4, end=4),
                     LinesRange(start=5, end=5),
                     LinesRange(start=7),
-                }
+                )
             )
         ),
         expected_src="""\
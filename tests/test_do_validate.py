@@ -71,13 +71,13 @@ _cases = [
         ),
         expected_options=Options(
             show_lines=LinesRanges(
-                {
+                (
                     LinesRange(start=1, end=2),
                     LinesRange(start=6, end=6),
                     LinesRange(start=7, end=10),
                     LinesRange(start=18, end=18),
                     LinesRange(start=19, end=20),
-                },
+                ),
             )
         ),
         expected_warnings=[
@@ -3,7 +3,9 @@
 
 """Tests for the LinesRange class."""
 
+import collections
 import dataclasses
+from unittest import mock
 
 import pytest
 
@@ -73,7 +75,7 @@ _invalid_init_test_cases = [
 
 
 @pytest.mark.parametrize("case", _invalid_init_test_cases, ids=lambda c: c.title)
-def test_invalid_init(case: _InvalidInitTestCase) -> None:  # TODO(cookiecutter): Remove
+def test_invalid_init(case: _InvalidInitTestCase) -> None:
     """Test invalid initializations fail."""
     with pytest.raises(ValueError) as excinfo:
         LinesRange(start=case.start, end=case.end)
@@ -172,3 +174,75 @@ _from_str_test_cases = [
 def test_from_str(case: _ValidFromStrTestCase) -> None:
     """Test that the parse method works."""
     assert LinesRange.parse(case.text) == case.expected
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _InvalidFromStrTestCase:
+    title: str
+    text: str
+    expected: ValueError
+
+
+_invalid_from_str_test_cases = [
+    _InvalidFromStrTestCase(title="Empty", text="", expected=ValueError("Empty start")),
+    _InvalidFromStrTestCase(
+        title="Only separator",
+        text=" : ",
+        expected=ValueError("Both start and end are empty"),
+    ),
+    _InvalidFromStrTestCase(
+        title="Multiple separators",
+        text="1:2:3",
+        expected=ValueError("invalid literal for int() with base 10: '2:3'"),
+    ),
+    _InvalidFromStrTestCase(
+        title="Not a number",
+        text="a:",
+        expected=ValueError("invalid literal for int() with base 10: 'a'"),
+    ),
+]
+
+
+@pytest.mark.parametrize("case", _invalid_from_str_test_cases, ids=lambda c: c.title)
+def test_invalid_from_str(case: _InvalidFromStrTestCase) -> None:
+    """Test that the parse method fails with invalid strings."""
+    with pytest.raises(ValueError) as excinfo:
+        LinesRange.parse(case.text)
+    assert str(excinfo.value) == str(case.expected)
+
+
+def test_hash() -> None:
+    """Test that equal ranges have the same hash and can be deduplicated."""
+    assert hash(LinesRange(start=1, end=2)) == hash(LinesRange.parse("1:2"))
+    assert hash(LinesRange(start=1)) != hash(LinesRange(end=1))
+    assert len({LinesRange(start=3), LinesRange.parse("3:"), LinesRange(end=3)}) == 2
+
+
+def test_get_is_shared() -> None:
+    """Test that equal shared and parsed ranges are the same instance."""
+    lines_range = LinesRange.get(start=2, end=4)
+    assert lines_range == LinesRange(start=2, end=4)
+    assert LinesRange.get(start=2, end=4) is lines_range
+    assert LinesRange.parse(" 2 : 4 ") is lines_range
+    assert LinesRange.get(start=2) is not lines_range
+    with pytest.raises(ValueError, match="Start must be less than or equal to end"):
+        LinesRange.get(start=4, end=2)
+
+
+def test_pool_evicts_least_recently_used() -> None:
+    """Test that the pool of shared ranges evicts the least recently used range."""
+    with (
+        mock.patch("pymdownx_superfence_filter_lines._LINES_RANGE_POOL_MAX_SIZE", 2),
+        mock.patch(
+            "pymdownx_superfence_filter_lines._lines_range_pool",
+            collections.OrderedDict(),
+        ),
+    ):
+        first = LinesRange.get(start=1)
+        second = LinesRange.get(start=2)
+        assert LinesRange.get(start=1) is first  # Now `second` is the least recent
+        third = LinesRange.get(start=3)
+        assert LinesRange.get(start=1) is first
+        assert LinesRange.get(start=3) is third
+        assert LinesRange.get(start=2) is not second
+        assert LinesRange.get(start=2) == second
@@ -0,0 +1,120 @@
+# License: MIT
+# Copyright © 2023 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the LinesRanges class."""
+
+import dataclasses
+import sys
+
+import pytest
+
+from pymdownx_superfence_filter_lines import LinesRange, LinesRanges
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _SelectedTestCase:
+    title: str
+    ranges: tuple[LinesRange, ...]
+    expected: list[int]
+
+
+_selected_test_cases = [
+    _SelectedTestCase(
+        title="Single line", ranges=(LinesRange(start=3, end=3),), expected=[3]
+    ),
+    _SelectedTestCase(
+        title="Open start", ranges=(LinesRange(end=3),), expected=[1, 2, 3]
+    ),
+    _SelectedTestCase(
+        title="Open end", ranges=(LinesRange(start=8),), expected=[8, 9, 10]
+    ),
+    _SelectedTestCase(
+        title="Past the end", ranges=(LinesRange(start=11),), expected=[]
+    ),
+    _SelectedTestCase(
+        title="Disjoint",
+        ranges=(LinesRange(start=9), LinesRange(end=1), LinesRange(start=4, end=5)),
+        expected=[1, 4, 5, 9, 10],
+    ),
+    _SelectedTestCase(
+        title="Overlapping and adjacent",
+        ranges=(
+            LinesRange(start=2, end=4),
+            LinesRange(start=3, end=6),
+            LinesRange(start=7, end=7),
+            LinesRange(start=5, end=5),
+        ),
+        expected=[2, 3, 4, 5, 6, 7],
+    ),
+]
+
+
+@pytest.mark.parametrize("case", _selected_test_cases, ids=lambda c: c.title)
+def test_selected(case: _SelectedTestCase) -> None:
+    """Test that only the lines inside the ranges are contained."""
+    lines_ranges = LinesRanges(case.ranges)
+    assert [n for n in range(1, 11) if n in lines_ranges] == case.expected
+
+
+def test_parse_is_cached() -> None:
+    """Test that parsing the same text twice reuses the parsed ranges."""
+    ranges1, errors1 = LinesRanges.parse("1:2,a,5:")
+    ranges2, errors2 = LinesRanges.parse("1:2,a,5:")
+    assert ranges1 is not None
+    assert ranges1 is ranges2
+    assert [str(e) for e in errors1] == [str(e) for e in errors2]
+    assert errors1 and errors1[0] is not errors2[0]
+
+
+def test_ranges_are_normalized() -> None:
+    """Test that ranges are deduplicated and sorted, regardless of the input order."""
+    lines_ranges = LinesRanges(
+        (
+            LinesRange(start=5),
+            LinesRange(start=2, end=3),
+            LinesRange(end=1),
+            LinesRange(start=2, end=3),
+        )
+    )
+    assert lines_ranges.ranges == (
+        LinesRange(end=1),
+        LinesRange(start=2, end=3),
+        LinesRange(start=5),
+    )
+    assert lines_ranges == LinesRanges(
+        (LinesRange(start=2, end=3), LinesRange(start=5), LinesRange(end=1))
+    )
+    assert str(lines_ranges) == ":1,2:3,5:"
+
+    # An open end and an end of `sys.maxsize` are different ranges
+    ranges1, _ = LinesRanges.parse(f"1:,1:{sys.maxsize}")
+    ranges2, _ = LinesRanges.parse(f"1:{sys.maxsize},1:")
+    assert ranges1 is not None
+    assert ranges1 == ranges2
+    assert str(ranges1) == str(ranges2) == f"1:{sys.maxsize},1:"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("1:", True),
+        ("1:5,3:10,8:", True),
+        (":4,5:", True),
+        ("1:5,7:", False),
+        ("2:", False),
+        (":100", False),
+    ],
+)
+def test_covers_all(text: str, expected: bool) -> None:
+    """Test that ranges covering all the lines are detected."""
+    lines_ranges, _ = LinesRanges.parse(text)
+    assert lines_ranges is not None
+    assert lines_ranges.covers_all is expected
+
+
+def test_contains() -> None:
+    """Test that only the lines inside any of the ranges are contained."""
+    lines_ranges = LinesRanges(
+        (LinesRange(start=8), LinesRange(end=2), LinesRange(start=4, end=5))
+    )
+    assert [n for n in range(1, 11) if n in lines_ranges] == [1, 2, 4, 5, 8, 9, 10]
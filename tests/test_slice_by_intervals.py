@@ -0,0 +1,71 @@
+# License: MIT
+# Copyright © 2023 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the _slice_by_intervals() function."""
+
+import dataclasses
+import sys
+
+import pytest
+
+from pymdownx_superfence_filter_lines import _slice_by_intervals
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _TestCase:
+    title: str
+    src: str
+    intervals: tuple[tuple[int, int], ...]
+    expected: str
+
+
+_cases = [
+    _TestCase(
+        title="Middle lines",
+        src="1\n2\n3\n4\n",
+        intervals=((2, 3),),
+        expected="2\n3\n",
+    ),
+    _TestCase(
+        title="Multiple intervals",
+        src="1\n2\n3\n4\n5\n",
+        intervals=((1, 1), (3, 3), (5, sys.maxsize)),
+        expected="1\n3\n5\n",
+    ),
+    _TestCase(
+        title="Last line without trailing newline",
+        src="1\n2\n3",
+        intervals=((2, 3),),
+        expected="2\n3",
+    ),
+    _TestCase(
+        title="Open end without trailing newline",
+        src="1\n2\n3",
+        intervals=((1, 1), (3, sys.maxsize)),
+        expected="1\n3",
+    ),
+    _TestCase(
+        title="Interval starts past the end",
+        src="1\n2\n3\n",
+        intervals=((2, 2), (10, 20)),
+        expected="2\n",
+    ),
+    _TestCase(
+        title="Interval starts past the end without trailing newline",
+        src="1\n2\n3",
+        intervals=((5, sys.maxsize),),
+        expected="",
+    ),
+    _TestCase(
+        title="Only newlines split lines",
+        src="1\x0cstill 1\n2\u2028still 2\r\n3\rstill 3\n4\n",
+        intervals=((2, 3),),
+        expected="2\u2028still 2\r\n3\rstill 3\n",
+    ),
+]
+
+
+@pytest.mark.parametrize("case", _cases, ids=lambda c: c.title)
+def test_slice_by_intervals(case: _TestCase) -> None:
+    """Test that only the lines inside the intervals are kept."""
+    assert _slice_by_intervals(case.src, case.intervals) == case.expected
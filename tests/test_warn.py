@@ -0,0 +1,53 @@
+# License: MIT
+# Copyright © 2023 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the _warn() function."""
+
+from typing import Any, Iterator
+from unittest import mock
+
+import pytest
+
+from pymdownx_superfence_filter_lines import _warn
+
+
+@pytest.fixture(autouse=True)
+def reset_warn_logger() -> Iterator[None]:
+    """Reset the warning logger, so it is determined again in each test."""
+    with mock.patch("pymdownx_superfence_filter_lines._warn_logger", None):
+        yield
+
+
+def _warn_from_module(module_name: str) -> None:
+    """Call `_warn()` from a frame with the given module name."""
+    namespace: dict[str, Any] = {"__name__": module_name, "_warn": _warn}
+    exec(  # pylint: disable=exec-used
+        "def warn() -> None:\n    _warn('Some %s', 'warning')\n", namespace
+    )
+    namespace["warn"]()
+
+
+def test_warn_inside_mkdocs(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that warnings go to the MkDocs logger when called from MkDocs."""
+    _warn_from_module("mkdocs.commands.build")
+    assert [(r.name, r.getMessage()) for r in caplog.records] == [
+        ("mkdocs", "Some warning")
+    ]
+
+
+def test_warn_outside_mkdocs(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that warnings go to the module logger when not called from MkDocs."""
+    _warn_from_module("mkdocsish")
+    assert [(r.name, r.getMessage()) for r in caplog.records] == [
+        ("pymdownx_superfence_filter_lines", "Some warning")
+    ]
+
+
+def test_warn_logger_is_reused(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the logger chosen for the first warning is used for later ones."""
+    _warn_from_module("some.module")
+    _warn_from_module("mkdocs.commands.build")
+    assert [r.name for r in caplog.records] == [
+        "pymdownx_superfence_filter_lines",
+        "pymdownx_superfence_filter_lines",
+    ]